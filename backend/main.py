@@ -1,11 +1,37 @@
-from fastapi import FastAPI
+import sqlite3
+from contextlib import closing
+from fastapi import FastAPI, Query
 from pydantic import BaseModel
 from typing import List
 
 app = FastAPI(title="Translation Backend API")
 
 # Data storage
-submissions = []
+DB_PATH = "submissions.db"
+INSERT_SUBMISSION = (
+    "INSERT INTO submissions (student, translation, score, time_taken) VALUES (?, ?, ?, ?)"
+)
+
+def get_conn():
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def init_db():
+    with closing(get_conn()) as conn, conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS submissions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                student TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                score REAL NOT NULL,
+                time_taken REAL NOT NULL
+            )"""
+        )
+
+init_db()
 
 class Submission(BaseModel):
     student: str
@@ -13,11 +39,28 @@ class Submission(BaseModel):
     score: float
     time_taken: float
 
+def submission_row(sub: Submission):
+    return (sub.student, sub.translation, sub.score, sub.time_taken)
+
 @app.post("/submissions/")
 def add_submission(sub: Submission):
-    submissions.append(sub.dict())
+    with closing(get_conn()) as conn, conn:
+        conn.execute(INSERT_SUBMISSION, submission_row(sub))
     return {"message": "Submission added successfully"}
 
+@app.post("/submissions/batch/")
+def add_submissions_batch(subs: List[Submission]):
+    # One transaction for the whole batch, so one commit instead of one per row
+    with closing(get_conn()) as conn, conn:
+        conn.executemany(INSERT_SUBMISSION, map(submission_row, subs))
+    return {"message": f"{len(subs)} submissions added successfully"}
+
 @app.get("/submissions/", response_model=List[Submission])
-def get_submissions():
-    return submissions
+def get_submissions(offset: int = Query(0, ge=0), limit: int = Query(50, ge=1, le=500)):
+    with closing(get_conn()) as conn:
+        rows = conn.execute(
+            "SELECT student, translation, score, time_taken FROM submissions "
+            "ORDER BY id LIMIT ? OFFSET ?",
+            (limit, offset),
+        ).fetchall()
+    return [dict(row) for row in rows]
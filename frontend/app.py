@@ -1,8 +1,33 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rapidfuzz import fuzz  # ✅ replacing Levenshtein
 
 API_URL = "https://editing-and-translation-tool.onrender.com"  # your backend URL
+PAGE_SIZE = 50  # submissions fetched per Instructor page
+
+@st.cache_resource
+def get_http():
+    # One pooled keep-alive session shared by every rerun and browser session
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+http = get_http()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_submissions(offset, limit):
+    # Cached per page so Instructor reruns don't refetch; errors raise and are never cached
+    res = http.get(f"{API_URL}/submissions/", params={"offset": offset, "limit": limit})
+    res.raise_for_status()
+    return res.json()
 
 st.title("Translation Evaluation Tool")
 
@@ -32,8 +57,9 @@ if choice == "Student":
             }
 
             try:
-                res = requests.post(f"{API_URL}/submissions/", json=data)
+                res = http.post(f"{API_URL}/submissions/", json=data)
                 if res.status_code == 200:
+                    fetch_submissions.clear()
                     st.success(f"Submitted successfully with score {score:.2f}")
                 else:
                     st.error(f"Failed to submit: {res.text}")
@@ -42,16 +68,27 @@ if choice == "Student":
 
 elif choice == "Instructor":
     st.subheader("View Submissions")
+    page = st.number_input("Page", min_value=1, step=1)
     try:
-        res = requests.get(f"{API_URL}/submissions/")
-        if res.status_code == 200:
-            submissions = res.json()
-            if submissions:
-                for sub in submissions:
-                    st.write(f"**{sub['student']}**: {sub['translation']} (Score: {sub['score']:.2f})")
-            else:
-                st.info("No submissions yet")
+        submissions = fetch_submissions((page - 1) * PAGE_SIZE, PAGE_SIZE)
+        if submissions:
+            # One virtualized table instead of one element per row; time_taken is not shown
+            st.dataframe(
+                submissions,
+                column_order=("student", "translation", "score"),
+                column_config={
+                    "student": "Student",
+                    "translation": "Translation",
+                    "score": st.column_config.NumberColumn("Score", format="%.2f"),
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
+        elif page > 1:
+            st.info("No submissions on this page")
         else:
-            st.error(f"Failed to fetch submissions: {res.text}")
+            st.info("No submissions yet")
+    except requests.HTTPError as e:
+        st.error(f"Failed to fetch submissions: {e.response.text}")
     except Exception as e:
         st.error(f"Could not connect to backend: {e}")